@@ -0,0 +1,22 @@
+#!/usr/bin/env bash
+# Package the rejection agent as a single-file zipapp (saif-reject.pyz).
+#
+# The archive ships precompiled .pyc files next to the source, so each run
+# loads marshalled bytecode instead of parsing and compiling the script.
+#
+# Usage: ./build_pyz.sh && ./saif-reject.pyz --examples
+set -euo pipefail
+
+cd "$(dirname "$0")"
+
+build_dir="$(mktemp -d)"
+trap 'rm -rf "$build_dir"' EXIT
+
+cp saif_rejection_agent.py saif_rejection_templates.py "$build_dir/"
+python3 -m compileall -q -b "$build_dir"
+python3 -m zipapp "$build_dir" \
+    -m saif_rejection_agent:main \
+    -p "/usr/bin/env python3" \
+    -o saif-reject.pyz
+
+echo "Built saif-reject.pyz"
@@ -13,58 +13,131 @@ Or use interactively:
     python saif_rejection_agent.py --interactive
 """
 
-import argparse
-import json
+from __future__ import annotations
+
+import re
 import sys
 from dataclasses import dataclass
-from typing import Optional
-from datetime import datetime
+from functools import lru_cache
+from typing import TYPE_CHECKING, Iterable, Iterator, Optional, TextIO
+
+from saif_rejection_templates import REJECTION_TEMPLATES
 
+if TYPE_CHECKING:
+    import anthropic
 
-@dataclass
+
+@dataclass(slots=True, frozen=True)
 class Application:
     """Represents a SAIF application."""
     company_name: str
     contact_email: str
     founder_names: Optional[str]
     description: str
-    rejection_reasons: list[str]
+    rejection_reasons: tuple[str, ...]
 
 
-# Common rejection reason templates based on the examples
-REJECTION_TEMPLATES = {
-    "not_ai_safety": {
-        "summary": "Product is not focused on AI safety",
-        "template": """Your work on {product_focus} is meaningful and clearly impactful. However, {company_name} is focused on {actual_focus} rather than on technologies that directly improve safety and security in the presence of risks created by advanced AI systems. Because of this, the project falls outside the scope of SAIF's investment mandate."""
-    },
-    "early_stage_no_team": {
-        "summary": "Too early stage with incomplete founding team",
-        "template": """{product_area} is an important direction, and we can see why this category will matter as agentic systems become more widely deployed. However, {company_name} is still at a very early stage, and we generally look for teams with a committed founding group, clear technical ownership, and a more defined product trajectory before engaging as investors. Given the current state of the team and the work, we don't believe this is the right fit for SAIF at this time."""
-    },
-    "no_tech_cofounder": {
-        "summary": "Lacks technical founding leadership",
-        "template": """{problem_statement} is an important problem, and we can see the appeal of a product that {product_appeal}. However, SAIF typically looks for teams with strong technical founding leadership given the complexity and competitiveness of building safety-critical AI systems. At this stage, and without a technical cofounder driving the core system, we don't believe {company_name} is the right fit for SAIF's focus."""
-    },
-    "too_conceptual": {
-        "summary": "Approach is too conceptual or lacks clear technical pathway",
-        "template": """Your proposal explores ambitious ideas around {topic_area}. However, the approach as described is highly conceptual, and it's difficult for us to assess a clear technical pathway, feasibility, or near-term product direction. SAIF's focus is on companies building practical, deployable technologies that can be validated and scaled to improve safety and security in real-world AI systems, and {company_name} does not currently align with that focus."""
-    },
-    "safety_angle_unclear": {
-        "summary": "Safety impact is not clear or central to the product",
-        "template": """{company_name}'s approach to {product_description} is thoughtful, and we can see how tools like this could be valuable for {target_users}. However, SAIF's focus is on companies building products that directly improve safety and security in the presence of advanced AI systems, and we are not yet convinced that {company_name}'s safety impact is sufficiently clear or central to the product. In addition, we typically look for teams with a full-time founder."""
-    },
-    "not_for_profit": {
-        "summary": "Not a for-profit company with scalable business model",
-        "template": """We appreciate the work you've put into {company_name} and your commitment to developing {mission}. However, SAIF is structured specifically to invest in for-profit companies with scalable business models. As {company_name} is {structure} and won't be offering equity to investors, we do not see a clear path for sufficient venture funding to be raised. Additionally, it is unclear to us that {distribution_concern}."""
-    },
-    "general_not_aligned": {
-        "summary": "General non-alignment with SAIF focus",
-        "template": """We appreciate your ambition to {mission}. However, {company_name} appears primarily focused on {actual_focus}, which, while potentially impactful, are not aligned with SAIF's mission. Our focus is specifically centered on companies building products that directly improve safety and security in the presence of threats caused or created by AI systems. Given this focus, {category} sit outside the scope of what we fund."""
-    }
+# Fixed opening and closing paragraphs; the email joins these with the
+# greeting and feedback in one pass
+_OPENING_TMPL = "Thanks very much for expressing interest in being part of SAIF and our efforts to create a better future with AI. Unfortunately at this time we don't think that %s fits within the criteria we are using for our fund."
+
+_CLOSING_TMPL = """We wish you the best as you continue {wish}.
+
+Best,
+The SAIF Team"""
+
+# Closing wish keywords in priority order; the first keyword found in the
+# description wins, regardless of where it appears
+_WISH_KEYWORDS = (
+    ("building", "building the company"),
+    ("develop", "building the company"),
+    ("platform", "developing the platform"),
+    ("research", "developing your ideas"),
+    ("product", "building and refining the product"),
+)
+_WISH_RE = re.compile("|".join(k for k, _ in _WISH_KEYWORDS), re.IGNORECASE)
+_DEFAULT_WISH = "developing your ideas"
+
+# There are only a handful of closing wishes, so every closing paragraph is
+# rendered once here and looked up per email
+_CLOSINGS = {
+    wish: _CLOSING_TMPL.format(wish=wish)
+    for wish in dict.fromkeys([*(w for _, w in _WISH_KEYWORDS), _DEFAULT_WISH])
 }
 
+# Rejection reason keys in menu order, for index-based selection
+_KEYS = tuple(REJECTION_TEMPLATES)
+
+# Reason menu shown by interactive mode
+_REASON_MENU = "\nAvailable rejection reasons:\n" + "".join(
+    f"  {i}. {key}: {value['summary']}\n"
+    for i, (key, value) in enumerate(REJECTION_TEMPLATES.items(), 1)
+)
+
+# Feedback blocks are constant per reason, so precompute them instead of
+# formatting the template on every call
+_FEEDBACK_BLOCKS = {
+    key: f"[TEMPLATE: {info['summary']}]\n{info['template']}"
+    for key, info in REJECTION_TEMPLATES.items()
+}
+
+# Model used when feedback is generated with Claude (matches the CRM API route)
+CLAUDE_MODEL = "claude-sonnet-4-20250514"
+
+# Static system prompt for Claude-generated feedback. It is identical for every
+# application and sent with cache_control, so only the first request in a
+# cache window pays for these tokens; per-application details go in the user
+# turn. Keep it above the 1024-token minimum for prompt caching.
+STATIC_PREAMBLE = """# SAIF Application Rejection Feedback
+
+You write the specific feedback paragraph of rejection emails for SAIF (Safe AI Fund) applications. The greeting, standard opening, closing wish and sign-off are added separately, so output ONLY the feedback paragraph: no greeting, no sign-off, no explanations.
+
+## Email Structure
+
+Every SAIF rejection email follows this structure, and you write only part 3:
+
+1. Greeting - personalized with founder name(s) if known, otherwise "Hi there,"
+2. Standard opening - thanks for their interest; unfortunately the company doesn't fit the criteria we are using for our fund
+3. Specific feedback - the heart of the email; explains why with nuance
+4. Well wishes - a brief, genuine closing wish about what they are building
+5. Sign-off - "Best, The SAIF Team"
+
+Because the opening already names the company and declines, the feedback paragraph should not thank the applicant again or restate that SAIF is passing. Start with what is genuinely good about the work, then explain the misfit.
+
+## Tone
+
+- Professional but warm
+- Empathetic without being condescending
+- Honest without being harsh
+- Constructive when possible
 
-def generate_rejection_email(application: Application) -> str:
+## Content Guidelines
+
+- Always acknowledge something positive about the application
+- Be specific about why it doesn't fit (without being mean)
+- Never share internal notes verbatim ("psychosis", "vibe coded", "not believable")
+- Never be condescending about the founders' technical abilities
+- Never promise to invest in the future
+- Never give detailed feedback that could start a debate
+- Never use phrases like "at this time" excessively
+- Offer a path forward only when genuinely appropriate ("We'd be happy to revisit the conversation in the future, particularly as you...")
+- Keep the paragraph to 3-5 sentences
+
+## Rejection Categories
+
+Each category below has a summary and a reference paragraph. Follow the structure and register of the reference for the primary rejection reason, replacing the placeholders in braces with specifics drawn from the application. If several reasons apply, lead with the primary one and fold in at most one secondary point.
+
+""" + "\n\n".join(
+    f"### {key}\n{info['summary']}\n\n{info['template']}"
+    for key, info in REJECTION_TEMPLATES.items()
+)
+
+
+def generate_rejection_email(
+    application: Application,
+    use_claude: bool = False,
+    client: Optional[anthropic.Anthropic] = None,
+) -> str:
     """
     Generate a rejection email based on the application details and rejection reasons.
     
@@ -74,7 +147,57 @@ def generate_rejection_email(application: Application) -> str:
     3. Specific feedback paragraph
     4. Well wishes
     5. Closing
+    
+    Renders are cached on the fields that shape the email, so repeated
+    applications (e.g. duplicate rows in a CRM export) are only rendered once.
+    With use_claude, the feedback paragraph is generated by Claude instead of
+    the templates and the result is not cached; pass a client from
+    make_claude_client() to reuse one connection across many emails.
     """
+    if use_claude:
+        return _assemble_email(application, generate_feedback_with_claude(application, client))
+    
+    return _render_email(
+        application.company_name,
+        application.founder_names,
+        application.description,
+        application.rejection_reasons,
+    )
+
+
+def write_rejection_email(
+    application: Application,
+    out: TextIO,
+    use_claude: bool = False,
+    client: Optional[anthropic.Anthropic] = None,
+) -> None:
+    """Generate a rejection email and write it to out."""
+    out.write(generate_rejection_email(application, use_claude=use_claude, client=client))
+
+
+@lru_cache(maxsize=4096)
+def _render_email(
+    company_name: str,
+    founder_names: Optional[str],
+    description: str,
+    rejection_reasons: tuple[str, ...],
+) -> str:
+    """Render a rejection email from the fields that affect its content."""
+    
+    # The contact email never appears in the body, so it is not part of the key
+    application = Application(
+        company_name=company_name,
+        contact_email="",
+        founder_names=founder_names,
+        description=description,
+        rejection_reasons=rejection_reasons,
+    )
+    
+    return _assemble_email(application, generate_feedback_paragraph(application))
+
+
+def _assemble_email(application: Application, feedback: str) -> str:
+    """Wrap a feedback paragraph in the standard SAIF email structure."""
     
     # Determine the greeting
     if application.founder_names:
@@ -82,83 +205,133 @@ def generate_rejection_email(application: Application) -> str:
     else:
         greeting = "Hi there,"
     
-    # Standard opening
-    opening = """Thanks very much for expressing interest in being part of SAIF and our efforts to create a better future with AI. Unfortunately at this time we don't think that {company} fits within the criteria we are using for our fund.""".format(
-        company=application.company_name
-    )
-    
-    # Generate the specific feedback paragraph based on rejection reasons
-    # This is where the agent would use Claude to generate contextual feedback
-    feedback = generate_feedback_paragraph(application)
-    
-    # Standard closing
-    closing = f"""We wish you the best as you continue {get_closing_wish(application)}.
-
-Best,
-The SAIF Team"""
+    opening = _OPENING_TMPL % application.company_name
+    closing = _CLOSINGS[get_closing_wish(application)]
     
-    # Combine all parts
-    email = f"""{greeting}
-
-{opening}
-
-{feedback}
-
-{closing}"""
-    
-    return email
+    return "\n\n".join((greeting, opening, feedback, closing))
 
 
 def generate_feedback_paragraph(application: Application) -> str:
     """
     Generate the specific feedback paragraph based on the rejection reasons.
     
-    This is a placeholder - in a real implementation, this would use Claude
-    to generate contextual, specific feedback based on the application.
+    This is the template-based fallback; generate_feedback_with_claude
+    produces contextual, specific feedback based on the application.
     """
     
-    # For now, provide a template-based approach
-    # In production, this would call Claude API for more nuanced generation
-    
     if not application.rejection_reasons:
         return f"While we appreciate your submission, {application.company_name} does not currently align with our investment criteria."
     
     primary_reason = application.rejection_reasons[0]
     
-    if primary_reason in REJECTION_TEMPLATES:
-        template_info = REJECTION_TEMPLATES[primary_reason]
+    feedback = _FEEDBACK_BLOCKS.get(primary_reason)
+    if feedback is not None:
         # Return the template - in production this would be filled in with details
-        return f"[TEMPLATE: {template_info['summary']}]\n{template_info['template']}"
+        return feedback
     
     return f"The project does not currently align with SAIF's focus on companies building practical technologies that directly improve safety and security in real-world AI systems."
 
 
+def make_claude_client() -> anthropic.Anthropic:
+    """
+    Create an Anthropic client for Claude-generated feedback.
+    
+    Raises RuntimeError if the anthropic package is not installed or no
+    credentials are configured. Create one client per run and pass it to each
+    call so its connection pool is reused.
+    """
+    try:
+        import anthropic
+    except ImportError:
+        raise RuntimeError("Claude feedback requires the anthropic package: pip install anthropic") from None
+    
+    try:
+        client = anthropic.Anthropic()
+    except anthropic.AnthropicError as e:
+        raise RuntimeError(f"Could not create Anthropic client: {e}") from None
+    
+    if client.api_key is None and client.auth_token is None:
+        client.close()
+        raise RuntimeError("Claude feedback requires ANTHROPIC_API_KEY to be set")
+    return client
+
+
+def generate_feedback_with_claude(application: Application, client: Optional[anthropic.Anthropic] = None) -> str:
+    """
+    Generate the specific feedback paragraph with Claude.
+    
+    STATIC_PREAMBLE is sent as a cached system block, so repeated calls only
+    pay full price for the short per-application user message. Requires the
+    anthropic package and ANTHROPIC_API_KEY unless a client is passed in.
+    
+    If the request fails (rate limits, overload, other API errors) or returns
+    no text, a warning is written to stderr and the template paragraph from
+    generate_feedback_paragraph is used, so a batch run never stops halfway
+    through an email.
+    """
+    import anthropic
+    
+    if client is None:
+        client = make_claude_client()
+    
+    reasons = ", ".join(application.rejection_reasons) or "general_not_aligned"
+    try:
+        response = client.messages.create(
+            model=CLAUDE_MODEL,
+            max_tokens=1024,
+            system=[
+                {
+                    "type": "text",
+                    "text": STATIC_PREAMBLE,
+                    "cache_control": {"type": "ephemeral"},
+                }
+            ],
+            messages=[
+                {
+                    "role": "user",
+                    "content": (
+                        f"Company: {application.company_name}\n"
+                        f"Description: {application.description}\n"
+                        f"Rejection reasons: {reasons}"
+                    ),
+                }
+            ],
+        )
+    except anthropic.APIError as e:
+        sys.stderr.write(f"Claude request failed for {application.company_name}, using template feedback: {e}\n")
+        return generate_feedback_paragraph(application)
+    
+    if not response.content or response.content[0].type != "text":
+        sys.stderr.write(f"Claude returned no text for {application.company_name}, using template feedback\n")
+        return generate_feedback_paragraph(application)
+    return response.content[0].text.strip()
+
+
 def get_closing_wish(application: Application) -> str:
     """Generate an appropriate closing wish based on the application."""
-    
-    # Determine appropriate closing based on what the company does
-    description_lower = application.description.lower()
-    
-    if "building" in description_lower or "develop" in description_lower:
-        return "building the company"
-    elif "platform" in description_lower:
-        return "developing the platform"
-    elif "research" in description_lower:
-        return "developing your ideas"
-    elif "product" in description_lower:
-        return "building and refining the product"
-    else:
-        return "developing your ideas"
+    return _wish_for(application.description)
 
 
-def print_examples():
-    """Print example rejection emails from the training data."""
+@lru_cache(maxsize=1024)
+def _wish_for(description: str) -> str:
+    """Pick the closing wish for a description; cached across a batch."""
+    
+    # Determine appropriate closing based on what the company does,
+    # collecting every keyword in a single pass over the description
+    found = {m.lower() for m in _WISH_RE.findall(description)}
     
-    examples = [
-        {
-            "company": "WormAI, Inc. (Sec0)",
-            "reason": "Early stage, no cofounder",
-            "email": """Hi Ashish,
+    for keyword, wish in _WISH_KEYWORDS:
+        if keyword in found:
+            return wish
+    return _DEFAULT_WISH
+
+
+# Example rejection emails from the training data, shown by --examples
+_EXAMPLES = (
+    {
+        "company": "WormAI, Inc. (Sec0)",
+        "reason": "Early stage, no cofounder",
+        "email": """Hi Ashish,
 
 Thanks very much for expressing interest in being part of SAIF and our efforts to create a better future with AI. Unfortunately at this time we don't think that Sec0 fits within the criteria we are using for our fund.
 
@@ -168,11 +341,11 @@ We wish you the best as you continue developing the idea and building toward a m
 
 Best,
 The SAIF Team"""
-        },
-        {
-            "company": "Tova",
-            "reason": "No technical cofounder",
-            "email": """Hi there,
+    },
+    {
+        "company": "Tova",
+        "reason": "No technical cofounder",
+        "email": """Hi there,
 
 Thanks very much for expressing interest in being part of SAIF and our efforts to create a better future with AI. Unfortunately at this time we don't think that Tova fits within the criteria we are using for our fund.
 
@@ -182,11 +355,11 @@ We wish you the best as you continue developing the product and exploring partne
 
 Best,
 The SAIF Team"""
-        },
-        {
-            "company": "VAITION",
-            "reason": "Too conceptual",
-            "email": """Hi Vadim,
+    },
+    {
+        "company": "VAITION",
+        "reason": "Too conceptual",
+        "email": """Hi Vadim,
 
 Thanks very much for expressing interest in being part of SAIF and our efforts to create a better future with AI. Unfortunately at this time we don't think that VAITION fits within the criteria we are using for our fund.
 
@@ -196,50 +369,88 @@ We appreciate you reaching out and wish you the best as you continue developing
 
 Best,
 The SAIF Team"""
-        }
+    }
+)
+
+_RULE = "=" * 80
+_EXAMPLES_RENDERED = "\n".join(
+    [f"\n{_RULE}", "EXAMPLE REJECTION EMAILS FROM SAIF", _RULE]
+    + [
+        f"\n--- Example {i}: {example['company']} ---\n"
+        f"Rejection Reason: {example['reason']}\n"
+        f"{'-' * 40}\n"
+        f"{example['email']}\n"
+        for i, example in enumerate(_EXAMPLES, 1)
     ]
+) + "\n"
+
+
+def print_examples():
+    """Print example rejection emails from the training data."""
+    sys.stdout.write(_EXAMPLES_RENDERED)
+
+
+def read_batch(f: TextIO) -> Iterator[Application]:
+    """
+    Stream applications from an open CSV file.
     
-    print("\n" + "="*80)
-    print("EXAMPLE REJECTION EMAILS FROM SAIF")
-    print("="*80)
-    
-    for i, example in enumerate(examples, 1):
-        print(f"\n--- Example {i}: {example['company']} ---")
-        print(f"Rejection Reason: {example['reason']}")
-        print("-" * 40)
-        print(example['email'])
-        print()
+    Expected columns: company_name, contact_email, founder_names, description
+    and rejection_reasons (semicolon-separated reason keys). Only
+    company_name is required; the header is checked before any row is read,
+    and a ValueError is raised if it is missing. The caller owns the file and
+    should open it with newline="" and encoding="utf-8-sig".
+    """
+    import csv
+    
+    reader = csv.DictReader(f)
+    if "company_name" not in (reader.fieldnames or ()):
+        raise ValueError("CSV is missing the required company_name column")
+    return _iter_batch(reader)
+
+
+def _iter_batch(reader) -> Iterator[Application]:
+    """Yield an Application per CSV row."""
+    for row in reader:
+        reasons = row.get("rejection_reasons") or ""
+        yield Application(
+            company_name=(row.get("company_name") or "").strip(),
+            contact_email=(row.get("contact_email") or "").strip(),
+            founder_names=(row.get("founder_names") or "").strip() or None,
+            description=row.get("description") or "",
+            rejection_reasons=tuple(r.strip() for r in reasons.split(";") if r.strip())
+        )
+
 
+def write_batch(
+    applications: Iterable[Application],
+    out: TextIO,
+    use_claude: bool = False,
+    client: Optional[anthropic.Anthropic] = None,
+) -> None:
+    """Write one headed rejection email per application to out as it is rendered."""
+    for app in applications:
+        out.write(f"--- {app.company_name} <{app.contact_email}> ---\n")
+        write_rejection_email(app, out, use_claude=use_claude, client=client)
+        out.write("\n\n")
 
-def interactive_mode():
+
+def interactive_mode(use_claude: bool = False, client: Optional[anthropic.Anthropic] = None):
     """Run the agent in interactive mode."""
     
-    print("\n" + "="*60)
-    print("SAIF Rejection Email Generator - Interactive Mode")
-    print("="*60)
-    
-    print("\nEnter application details:")
+    rule = "=" * 60
+    sys.stdout.write(f"\n{rule}\nSAIF Rejection Email Generator - Interactive Mode\n{rule}\n")
     
-    company_name = input("Company Name: ").strip()
+    company_name = input("\nEnter application details:\nCompany Name: ").strip()
     contact_email = input("Contact Email: ").strip()
     founder_names = input("Founder Name(s) [leave blank if unknown]: ").strip() or None
     
     print("\nEnter company description (press Enter twice to finish):")
-    description_lines = []
-    while True:
-        line = input()
-        if line == "":
-            break
-        description_lines.append(line)
-    description = "\n".join(description_lines)
-    
-    print("\nAvailable rejection reasons:")
-    for i, (key, value) in enumerate(REJECTION_TEMPLATES.items(), 1):
-        print(f"  {i}. {key}: {value['summary']}")
-    
-    reason_input = input("\nEnter rejection reason number(s), comma-separated: ").strip()
+    description = "\n".join(iter(input, ""))
+    
+    reason_input = input(_REASON_MENU + "\nEnter rejection reason number(s), comma-separated: ").strip()
     reason_indices = [int(x.strip()) - 1 for x in reason_input.split(",") if x.strip()]
-    rejection_reasons = [list(REJECTION_TEMPLATES.keys())[i] for i in reason_indices if 0 <= i < len(REJECTION_TEMPLATES)]
+    n = len(_KEYS)
+    rejection_reasons = tuple(_KEYS[i] for i in reason_indices if 0 <= i < n)
     
     app = Application(
         company_name=company_name,
@@ -253,10 +464,13 @@ def interactive_mode():
     print("GENERATED REJECTION EMAIL")
     print("="*60)
     print()
-    print(generate_rejection_email(app))
+    print(generate_rejection_email(app, use_claude=use_claude, client=client))
 
 
 def main():
+    # Imported here so library use of this module doesn't load argparse
+    import argparse
+    
     parser = argparse.ArgumentParser(
         description="Generate SAIF application rejection emails",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -271,6 +485,10 @@ Examples:
   Command line mode:
     python saif_rejection_agent.py --company "Acme AI" --contact "founder@acme.ai" \\
         --description "AI productivity tool" --reason "not_ai_safety"
+    
+  Batch mode (CSV with company_name, contact_email, founder_names,
+  description and semicolon-separated rejection_reasons columns):
+    python saif_rejection_agent.py --batch rejections.csv > emails.txt
         """
     )
     
@@ -281,6 +499,8 @@ Examples:
     parser.add_argument("--founders", type=str, help="Founder name(s)")
     parser.add_argument("--description", type=str, help="Company description")
     parser.add_argument("--reason", type=str, action="append", help="Rejection reason(s)")
+    parser.add_argument("--batch", type=str, metavar="CSV", help="Generate emails for every row of a CSV file")
+    parser.add_argument("--claude", action="store_true", help="Generate the feedback paragraph with Claude")
     
     args = parser.parse_args()
     
@@ -288,21 +508,44 @@ Examples:
         print_examples()
         return
     
-    if args.interactive:
-        interactive_mode()
-        return
-    
-    if args.company and args.description:
-        app = Application(
-            company_name=args.company,
-            contact_email=args.contact or "",
-            founder_names=args.founders,
-            description=args.description,
-            rejection_reasons=args.reason or []
-        )
-        print(generate_rejection_email(app))
-    else:
-        parser.print_help()
+    # One client for the whole run, so batch rows share its connection pool.
+    # Created before any output so a setup failure never leaves partial emails.
+    client = None
+    if args.claude:
+        try:
+            client = make_claude_client()
+        except RuntimeError as e:
+            parser.error(str(e))
+    
+    try:
+        if args.interactive:
+            interactive_mode(use_claude=args.claude, client=client)
+        elif args.batch:
+            # utf-8-sig strips the BOM that Excel and CRM exports often add
+            try:
+                f = open(args.batch, newline="", encoding="utf-8-sig")
+            except OSError as e:
+                parser.error(f"cannot read {args.batch}: {e.strerror}")
+            with f:
+                try:
+                    applications = read_batch(f)
+                except ValueError as e:
+                    parser.error(f"{args.batch}: {e}")
+                write_batch(applications, sys.stdout, use_claude=args.claude, client=client)
+        elif args.company and args.description:
+            app = Application(
+                company_name=args.company,
+                contact_email=args.contact or "",
+                founder_names=args.founders,
+                description=args.description,
+                rejection_reasons=tuple(args.reason or ())
+            )
+            print(generate_rejection_email(app, use_claude=args.claude, client=client))
+        else:
+            parser.print_help()
+    finally:
+        if client is not None:
+            client.close()
 
 
 if __name__ == "__main__":
@@ -0,0 +1,38 @@
+"""
+Rejection reason templates for the SAIF rejection email generator.
+
+Kept in their own module so the large constant table is separate from the
+generator logic and can be edited (or precompiled) on its own.
+"""
+
+# Common rejection reason templates based on the examples
+REJECTION_TEMPLATES = {
+    "not_ai_safety": {
+        "summary": "Product is not focused on AI safety",
+        "template": """Your work on {product_focus} is meaningful and clearly impactful. However, {company_name} is focused on {actual_focus} rather than on technologies that directly improve safety and security in the presence of risks created by advanced AI systems. Because of this, the project falls outside the scope of SAIF's investment mandate."""
+    },
+    "early_stage_no_team": {
+        "summary": "Too early stage with incomplete founding team",
+        "template": """{product_area} is an important direction, and we can see why this category will matter as agentic systems become more widely deployed. However, {company_name} is still at a very early stage, and we generally look for teams with a committed founding group, clear technical ownership, and a more defined product trajectory before engaging as investors. Given the current state of the team and the work, we don't believe this is the right fit for SAIF at this time."""
+    },
+    "no_tech_cofounder": {
+        "summary": "Lacks technical founding leadership",
+        "template": """{problem_statement} is an important problem, and we can see the appeal of a product that {product_appeal}. However, SAIF typically looks for teams with strong technical founding leadership given the complexity and competitiveness of building safety-critical AI systems. At this stage, and without a technical cofounder driving the core system, we don't believe {company_name} is the right fit for SAIF's focus."""
+    },
+    "too_conceptual": {
+        "summary": "Approach is too conceptual or lacks clear technical pathway",
+        "template": """Your proposal explores ambitious ideas around {topic_area}. However, the approach as described is highly conceptual, and it's difficult for us to assess a clear technical pathway, feasibility, or near-term product direction. SAIF's focus is on companies building practical, deployable technologies that can be validated and scaled to improve safety and security in real-world AI systems, and {company_name} does not currently align with that focus."""
+    },
+    "safety_angle_unclear": {
+        "summary": "Safety impact is not clear or central to the product",
+        "template": """{company_name}'s approach to {product_description} is thoughtful, and we can see how tools like this could be valuable for {target_users}. However, SAIF's focus is on companies building products that directly improve safety and security in the presence of advanced AI systems, and we are not yet convinced that {company_name}'s safety impact is sufficiently clear or central to the product. In addition, we typically look for teams with a full-time founder."""
+    },
+    "not_for_profit": {
+        "summary": "Not a for-profit company with scalable business model",
+        "template": """We appreciate the work you've put into {company_name} and your commitment to developing {mission}. However, SAIF is structured specifically to invest in for-profit companies with scalable business models. As {company_name} is {structure} and won't be offering equity to investors, we do not see a clear path for sufficient venture funding to be raised. Additionally, it is unclear to us that {distribution_concern}."""
+    },
+    "general_not_aligned": {
+        "summary": "General non-alignment with SAIF focus",
+        "template": """We appreciate your ambition to {mission}. However, {company_name} appears primarily focused on {actual_focus}, which, while potentially impactful, are not aligned with SAIF's mission. Our focus is specifically centered on companies building products that directly improve safety and security in the presence of threats caused or created by AI systems. Given this focus, {category} sit outside the scope of what we fund."""
+    }
+}